@@ -5,16 +5,26 @@ Author: Ridhi Moda
 
 import os
 import sys
+import atexit
+import string
 import time
+import asyncio
+import shutil
+import sqlite3
+import hashlib
 import logging
 import requests
+from contextlib import closing
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from copy import copy
 from collections import Counter
 from datetime import datetime
 from urllib.parse import urljoin
 
-import pandas as pd
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle, DEFAULT_FONT
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -26,7 +36,7 @@ from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.safari.options import Options as SafariOptions
 
-from googletrans import Translator
+import httpx
 
 # ← Load your .env so the credentials are in os.environ
 from dotenv import load_dotenv
@@ -35,8 +45,149 @@ load_dotenv()
 # ← BrowserStack Local tunnel helper
 from browserstack.local import Local
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from threading import Lock, Thread
+
+BASE_URL    = "https://elpais.com"
+OPINION_URL = "https://elpais.com/opinion/"
+
+# Ad/tracker hosts blocked while scraping (only article HTML is needed)
+BLOCKED_URLS = ['*doubleclick*', '*googlesyndication*', '*google-analytics*']
+
+# Section labels that share the title markup but aren't article titles
+_TITLE_BLACKLIST = frozenset({
+    'EDITORIAL', 'TRIBUNA', 'COLUMNA', 'CARTAS AL DIRECTOR', 'EXPOSICIÓN'
+})
+
+# Strips punctuation from words before counting
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Walks the Opinion page in-browser and returns up to `limit` novel articles'
+# fields in a single WebDriver round-trip.
+# Arguments: seen titles, title blacklist, limit.
+JS_EXTRACT = """
+const seen = new Set(arguments[0]);
+const blacklist = new Set(arguments[1]);
+const limit = arguments[2];
+const selectors = ["article.c_c", "article.c", "div.c_c article", "section article"];
+let nodes = [], used = "<article> tag";
+for (const sel of selectors) {
+    const found = document.querySelectorAll(sel);
+    if (found.length) { nodes = found; used = sel; break; }
+}
+if (!nodes.length) nodes = document.getElementsByTagName("article");
+const text = el => (el.innerText || "").trim();
+const articles = [];
+for (const n of nodes) {
+    if (articles.length >= limit) break;
+    if (text(n).length < 50) continue;
+    const te = Array.from(
+        n.querySelectorAll("h2.c_t, h2 a, h3.c_t, h3 a, header h2, header h3, .c_t")
+    ).find(e => {
+        const t = text(e);
+        return t && !blacklist.has(t) && !seen.has(t);
+    });
+    if (!te) continue;
+    const title = text(te);
+    seen.add(title);
+    const link = n.querySelector("a");
+    const img = n.querySelector("img");
+    const summary = Array.from(
+        n.querySelectorAll("p.c_d, p.c-d__sumario, p, .c_d, .description")
+    ).map(text).find(t => t.length > 20);
+    articles.push({
+        title: title,
+        href: te.tagName === "A" ? te.href : (link ? link.href : ""),
+        summary: summary || "Summary not available",
+        img: img ? (img.src || img.getAttribute("data-src") || "") : ""
+    });
+}
+return {selector: used, articles: articles};
+"""
+
+# Process-wide worker pool for I/O-bound jobs such as image downloads
+GLOBAL_POOL = ThreadPoolExecutor(max_workers=16)
+atexit.register(GLOBAL_POOL.shutdown)
+
+# Serializes access to the on-disk translation cache across sessions
+_cache_lock = Lock()
+
+TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+TRANSLATE_CONCURRENCY = 4   # in-flight requests to the translate endpoint
+TRANSLATE_RETRIES     = 3   # extra attempts on 429/5xx, with backoff
+
+
+async def translate_one(client, text):
+    """Translate a single Spanish string to English"""
+    for attempt in range(TRANSLATE_RETRIES + 1):
+        resp = await client.get(TRANSLATE_URL, params={
+            'client': 'gtx', 'sl': 'es', 'tl': 'en', 'dt': 't', 'q': text
+        })
+        retryable = resp.status_code == 429 or resp.status_code >= 500
+        if retryable and attempt < TRANSLATE_RETRIES:
+            await asyncio.sleep(0.5 * 2 ** attempt)
+            continue
+        resp.raise_for_status()
+        return ''.join(seg[0] for seg in resp.json()[0] if seg[0])
+
+
+async def translate_all(client, texts):
+    """Translate all strings concurrently over one pooled HTTP/2 connection"""
+    sem = asyncio.Semaphore(TRANSLATE_CONCURRENCY)
+
+    async def limited(text):
+        async with sem:
+            return await translate_one(client, text)
+
+    return await asyncio.gather(
+        *[limited(t) for t in texts],
+        return_exceptions=True
+    )
+
+
+# Process-wide translation backend: one event loop thread and one
+# AsyncClient, created on first use and shared by every scraper
+_translate_lock   = Lock()
+_translate_loop   = None
+_translate_thread = None
+_translate_client = None
+
+
+def _close_translation_backend():
+    if _translate_loop is None or _translate_loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(
+            _translate_client.aclose(), _translate_loop
+        ).result(timeout=5)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error closing translation client: {e!r}")
+    _translate_loop.call_soon_threadsafe(_translate_loop.stop)
+    _translate_thread.join(timeout=5)
+    if not _translate_thread.is_alive():
+        _translate_loop.close()
+
+
+def translate_texts(texts):
+    """Translate strings on the shared backend, blocking until done"""
+    global _translate_loop, _translate_thread, _translate_client
+    with _translate_lock:
+        if _translate_loop is None:
+            _translate_loop = asyncio.new_event_loop()
+            _translate_thread = Thread(
+                target=_translate_loop.run_forever,
+                name="translation-loop", daemon=True
+            )
+            _translate_thread.start()
+            _translate_client = httpx.AsyncClient(
+                http2=True, timeout=15,
+                limits=httpx.Limits(max_keepalive_connections=4),
+                headers={'User-Agent': 'Mozilla/5.0'}
+            )
+            atexit.register(_close_translation_backend)
+    return asyncio.run_coroutine_threadsafe(
+        translate_all(_translate_client, texts), _translate_loop
+    ).result()
 
 
 class ElPaisLocalScraper:
@@ -46,15 +197,34 @@ class ElPaisLocalScraper:
     
     def __init__(self, base_dir=None):
         """Initialize scraper with directory setup"""
-        self.translator = Translator()
-        self.base_url = "https://elpais.com"
-        self.opinion_url = "https://elpais.com/opinion/"
+        # Keep-alive HTTP session shared by all image downloads
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        ))
+        self.http.headers.update({
+            'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip'
+        })
+        
+        self.base_url = BASE_URL
+        self.opinion_url = OPINION_URL
         
         # Setup directories
         self.base_dir = base_dir or os.getcwd()
         self.images_dir = os.path.join(self.base_dir, "article_images")
         os.makedirs(self.images_dir, exist_ok=True)
         
+        # Persistent translation cache (source-text hash → English)
+        self.cache_path = os.path.join(self.base_dir, "translations.sqlite")
+        with _cache_lock, closing(sqlite3.connect(self.cache_path)) as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS cache (h TEXT PRIMARY KEY, en TEXT)"
+            )
+        
         # Setup logging
         log_filename = os.path.join(
             self.base_dir,
@@ -81,146 +251,119 @@ class ElPaisLocalScraper:
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        # Images are downloaded via requests, so the browser needn't fetch them
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
         
         driver = webdriver.Chrome(options=chrome_options)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+        except Exception as e:
+            self.logger.warning(f"Could not block ad/tracker URLs: {e}")
         self.logger.info("Chrome driver created successfully")
         return driver
     
     def download_image(self, image_url, article_index):
         """Download article cover image"""
+        resp = None
+        tmp_path = None
         try:
             self.logger.info(f"Downloading image for article {article_index}: {image_url}")
-            resp = requests.get(
-                image_url, timeout=10,
-                headers={'User-Agent': 'Mozilla/5.0'}
-            )
-            if resp.status_code == 200:
-                filename = f"article_{article_index}_cover.jpg"
-                filepath = os.path.join(self.images_dir, filename)
-                with open(filepath, 'wb') as f:
-                    f.write(resp.content)
-                self.logger.info(f"Successfully downloaded image: {filepath}")
-                return filepath
-            else:
-                self.logger.warning(f"Failed to download image: {resp.status_code}")
+            resp = self.http.get(image_url, timeout=10, stream=True)
+            resp.raise_for_status()
+            filename = f"article_{article_index}_cover.jpg"
+            filepath = os.path.join(self.images_dir, filename)
+            # Stream to a temp file so a failed transfer never leaves a partial image
+            tmp_path = filepath + ".part"
+            resp.raw.decode_content = True
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(resp.raw, f, length=64 * 1024)
+            os.replace(tmp_path, filepath)
+            tmp_path = None
+            self.logger.info(f"Successfully downloaded image: {filepath}")
+            return filepath
+        except requests.HTTPError as e:
+            self.logger.warning(f"Failed to download image: {e}")
         except Exception as e:
             self.logger.error(f"Error downloading image: {e}")
+        finally:
+            if resp is not None:
+                resp.close()
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
         return None
     
-    def get_article_summary(self, article_element):
-        """Get article summary from the main page"""
-        selectors = ["p.c_d","p.c-d__sumario","p",".c_d",".description"]
-        for sel in selectors:
-            try:
-                elem = article_element.find_element(By.CSS_SELECTOR, sel)
-                txt  = elem.text.strip()
-                if txt and len(txt) > 20:
-                    return txt
-            except:
-                continue
-        return "Summary not available"
-    
-    def scrape_articles(self, driver):
-        """Main scraping logic - Opinion section only"""
+    def scrape_articles(self, driver, shot_path=None):
+        """Main scraping logic - Opinion section only.
+        
+        The landing-page screenshot is taken from the already-loaded DOM
+        and saved to shot_path (defaults to base_dir).
+        """
         try:
             self.logger.info("Starting scraping process...")
             driver.get(self.opinion_url)
-            time.sleep(20)
+            try:
+                WebDriverWait(driver,25).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR,"article"))
+                )
+            except Exception:
+                self.logger.warning("Timed out waiting for articles to load")
             
             # Handle cookie consent
             try:
                 btn = WebDriverWait(driver,5).until(
                     EC.element_to_be_clickable((By.ID,"didomi-notice-agree-button"))
                 )
-                btn.click(); time.sleep(12)
+                btn.click()
                 self.logger.info("Cookie consent handled")
             except:
                 self.logger.info("No cookie banner")
+            else:
+                try:
+                    WebDriverWait(driver,12).until(
+                        EC.invisibility_of_element_located((By.ID,"didomi-notice-agree-button"))
+                    )
+                except Exception:
+                    self.logger.warning("Cookie banner still visible")
             
             # Screenshot landing page
-            shot = os.path.join(self.base_dir,"opinion_page_screenshot.png")
+            shot = shot_path or os.path.join(self.base_dir,"opinion_page_screenshot.png")
             driver.save_screenshot(shot)
             self.logger.info(f"Screenshot saved: {shot}")
             
-            # Find up to 5 articles
-            selectors = ["article.c_c","article.c","div.c_c article","section article"]
-            articles = []
-            for sel in selectors:
-                found = driver.find_elements(By.CSS_SELECTOR, sel)
-                if found:
-                    articles = found
-                    self.logger.info(f"Found {len(articles)} articles using {sel}")
-                    break
-            if not articles:
-                articles = driver.find_elements(By.TAG_NAME, "article")
-                self.logger.info(f"Found {len(articles)} articles by <article> tag")
+            # Extract up to 5 unseen articles in one script call
+            result = driver.execute_script(
+                JS_EXTRACT, list(self.seen_titles), list(_TITLE_BLACKLIST), 5
+            )
+            articles = result['articles']
+            self.logger.info(f"Found {len(articles)} new articles using {result['selector']}")
             
-            count = 0
-            for art in articles:
-                if count >= 5:
-                    break
-                try:
-                    text = art.text.strip()
-                    if len(text) < 50:
-                        continue
-                    data = {
-                        'article_number': count+1,
-                        'spanish_title': '',
-                        'english_title': '',
-                        'spanish_content': '',
-                        'english_content': '',
-                        'image_url': '',
-                        'image_path': '',
-                        'article_url': ''
-                    }
-                    # Title extraction
-                    t_selectors = [
-                        "h2.c_t","h2 a","h3.c_t","h3 a",
-                        "header h2","header h3",".c_t"
-                    ]
-                    for ts in t_selectors:
-                        try:
-                            te = art.find_element(By.CSS_SELECTOR, ts)
-                            txt = te.text.strip()
-                            if (txt 
-                                and txt not in [
-                                    'EDITORIAL','TRIBUNA','COLUMNA',
-                                    'CARTAS AL DIRECTOR','EXPOSICIÓN'
-                                ] 
-                                and txt not in self.seen_titles
-                            ):
-                                data['spanish_title'] = txt
-                                self.seen_titles.add(txt)
-                                if te.tag_name == 'a':
-                                    data['article_url'] = te.get_attribute("href")
-                                else:
-                                    try:
-                                        link = art.find_element(By.CSS_SELECTOR,"a")
-                                        data['article_url'] = link.get_attribute("href")
-                                    except:
-                                        pass
-                                break
-                        except:
-                            continue
-                    if not data['spanish_title']:
-                        continue
-                    
-                    data['spanish_content'] = self.get_article_summary(art)
-                    # Pick up image URL
-                    try:
-                        ie = art.find_element(By.CSS_SELECTOR,"img")
-                        url = ie.get_attribute("src") or ie.get_attribute("data-src")
-                        if url and not url.startswith("http"):
-                            url = urljoin(self.base_url, url)
-                        data['image_url'] = url
-                    except:
-                        self.logger.info("No image for this article")
-                    
-                    self.logger.info(f"Artículo {count+1}: {data['spanish_title']}")
-                    self.articles_data.append(data)
-                    count += 1
-                except Exception as e:
-                    self.logger.error(f"Error processing article: {e}")
+            for count, art in enumerate(articles, start=1):
+                data = {
+                    'article_number': count,
+                    'spanish_title': art['title'],
+                    'english_title': '',
+                    'spanish_content': art['summary'],
+                    'english_content': '',
+                    'image_url': '',
+                    'image_path': '',
+                    'article_url': art['href']
+                }
+                self.seen_titles.add(art['title'])
+                # Pick up image URL
+                url = art['img']
+                if url:
+                    if not url.startswith("http"):
+                        url = urljoin(self.base_url, url)
+                    data['image_url'] = url
+                else:
+                    self.logger.info("No image for this article")
+                
+                self.logger.info(f"Artículo {count}: {data['spanish_title']}")
+                self.articles_data.append(data)
             self.logger.info(f"Total scraped: {len(self.articles_data)}")
             return True
         except Exception as e:
@@ -228,57 +371,110 @@ class ElPaisLocalScraper:
             return False
     
     def download_all_images(self):
-        """Download all article images"""
+        """Download all article images in parallel"""
         self.logger.info("Downloading images...")
-        for art in self.articles_data:
-            if art['image_url']:
-                path = self.download_image(
-                    art['image_url'], art['article_number']
-                )
-                if path:
-                    art['image_path'] = path
+        pending = [a for a in self.articles_data if a['image_url']]
+        if not pending:
+            return
+        futs = {
+            GLOBAL_POOL.submit(
+                self.download_image, art['image_url'], art['article_number']
+            ): art for art in pending
+        }
+        for f in as_completed(futs):
+            futs[f]['image_path'] = f.result() or ''
+    
+    @staticmethod
+    def _cache_key(text):
+        """Hash source text into a compact cache key"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_get(self, keys):
+        """Return {key: translation} for keys already in the cache"""
+        with _cache_lock, closing(sqlite3.connect(self.cache_path)) as db:
+            return {
+                h: en for h in keys
+                for (en,) in db.execute("SELECT en FROM cache WHERE h=?", (h,))
+            }
+    
+    def _cache_put(self, pairs):
+        """Store (key, translation) pairs in the cache"""
+        # Outer context closes the connection, inner one commits
+        with _cache_lock, closing(sqlite3.connect(self.cache_path)) as db, db:
+            db.executemany(
+                "INSERT OR REPLACE INTO cache (h, en) VALUES (?, ?)", pairs
+            )
+    
+    def _translate_uncached(self, texts):
+        """Translate a list of strings concurrently via the HTTP backend"""
+        if not texts:
+            return []
+        translated = []
+        for res in translate_texts(texts):
+            if isinstance(res, Exception):
+                self.logger.error(f"Translation error: {res}")
+                translated.append("Translation failed")
+            else:
+                translated.append(res)
+        return translated
+    
+    def _translate_batch(self, texts):
+        """Translate a list of strings, serving repeats from the cache"""
+        keys = [self._cache_key(t) for t in texts]
+        try:
+            cached = self._cache_get(set(keys))
+        except sqlite3.Error as e:
+            self.logger.error(f"Translation cache read error: {e}")
+            cached = {}
+        hits = len(cached)
+        misses = list({k: t for k, t in zip(keys, texts) if k not in cached}.items())
+        if misses:
+            fresh = self._translate_uncached([t for _, t in misses])
+            new = {k: en for (k, _), en in zip(misses, fresh)}
+            cached.update(new)
+            try:
+                self._cache_put([
+                    (k, en) for k, en in new.items() if en != "Translation failed"
+                ])
+            except sqlite3.Error as e:
+                self.logger.error(f"Translation cache write error: {e}")
+        self.logger.info(
+            f"Translations: {hits} cached, {len(misses)} fetched"
+        )
+        return [cached[k] for k in keys]
     
     def translate_content(self):
         """Translate Spanish → English"""
         self.logger.info("Starting translation...")
-        for art in self.articles_data:
-            try:
-                if art['spanish_title']:
-                    t = self.translator.translate(
-                        art['spanish_title'], src='es', dest='en'
-                    )
-                    art['english_title'] = t.text
-                    self.logger.info(
-                        f"Title: {art['spanish_title']} → {t.text}"
-                    )
-                if art['spanish_content']:
-                    txt = art['spanish_content']
-                    if len(txt) > 1000:
-                        txt = txt[:1000] + "..."
-                    t = self.translator.translate(
-                        txt, src='es', dest='en'
-                    )
-                    art['english_content'] = t.text
-            except Exception as e:
-                self.logger.error(f"Translation error: {e}")
-                art['english_title']   = "Translation failed"
-                art['english_content'] = "Translation failed"
-                time.sleep(1)
+        titled = [a for a in self.articles_data if a['spanish_title']]
+        bodied = [a for a in self.articles_data if a['spanish_content']]
+        titles = [a['spanish_title'] for a in titled]
+        bodies = [
+            (a['spanish_content'][:1000] + "...")
+            if len(a['spanish_content']) > 1000 else a['spanish_content']
+            for a in bodied
+        ]
+        # One batch for titles and bodies so every request shares a connection
+        results = self._translate_batch(titles + bodies)
+        
+        for art, t in zip(titled, results[:len(titles)]):
+            art['english_title'] = t
+            self.logger.info(f"Title: {art['spanish_title']} → {t}")
+        for art, t in zip(bodied, results[len(titles):]):
+            art['english_content'] = t
 
     def analyze_word_frequency(self):
         """Analyze word frequency from translated titles"""
         self.logger.info("\n=== WORD FREQUENCY ANALYSIS ===")
         
-        all_words = []
-        for article in self.articles_data:
-            if article.get('english_title') and article['english_title'] != "Translation failed":
-                words = article['english_title'].lower().split()
-                # Remove common stop words
-               #  stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'it', 'that', 'this', 'as'}
-              # words = [word.strip('.,!?;:"\'-()[]{}') for word in words]
-                all_words.extend(words)
-        
-        word_counts = Counter(all_words)
+        titles = (
+            article['english_title'] for article in self.articles_data
+            if article.get('english_title') and article['english_title'] != "Translation failed"
+        )
+        word_counts = Counter(
+            word for title in titles
+            for word in title.lower().translate(_PUNCT_TABLE).split()
+        )
         repeated_words = {word: count for word, count in word_counts.items() if count > 2}
         
         # Log results
@@ -342,35 +538,37 @@ class ElPaisLocalScraper:
             self.base_dir,
             f'ElPais_Analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
         )
-        wb = Workbook()
-        # — Styles & sheets exactly as before —
-        # Sheet1: Article Details
-        ws1 = wb.active
-        ws1.title = "Article Details"
-        header_font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-        header_fill = PatternFill(
-            start_color='1F4E79', end_color='1F4E79', fill_type='solid'
-        )
-        header_align = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        # Write-only mode streams rows to disk instead of keeping every cell
+        wb = Workbook(write_only=True)
         thin = Border(
             left=Side(style='thin'), right=Side(style='thin'),
             top=Side(style='thin'), bottom=Side(style='thin')
         )
-        cols = [
-            'Article Number','Spanish Title','English Title',
-            'Spanish Content','English Content'
-        ]
-        for idx, h in enumerate(cols,1):
-            c = ws1.cell(row=1, column=idx, value=h)
-            c.font, c.fill, c.alignment, c.border = (
-                header_font, header_fill, header_align, thin
-            )
-        for r, art in enumerate(self.articles_data, start=2):
-            ws1.cell(row=r, column=1, value=art['article_number']).border = thin
-            ws1.cell(row=r, column=2, value=art['spanish_title']).border = thin
-            ws1.cell(row=r, column=3, value=art['english_title']).border = thin
-            ws1.cell(row=r, column=4, value=art['spanish_content']).border = thin
-            ws1.cell(row=r, column=5, value=art['english_content']).border = thin
+        # Register styles once so cells share a single style-table entry
+        bordered = NamedStyle(name='bordered', font=copy(DEFAULT_FONT), border=thin)
+        hdr_style = NamedStyle(
+            name='hdr_style',
+            font=Font(name='Arial', size=11, bold=True, color='FFFFFF'),
+            fill=PatternFill(
+                start_color='1F4E79', end_color='1F4E79', fill_type='solid'
+            ),
+            alignment=Alignment(horizontal='center', vertical='center', wrap_text=True),
+            border=thin
+        )
+        wb.add_named_style(bordered)
+        wb.add_named_style(hdr_style)
+        
+        def styled(ws, values, style):
+            cells = []
+            for v in values:
+                c = WriteOnlyCell(ws, value=v)
+                c.style = style
+                cells.append(c)
+            return cells
+        
+        # Sheet1: Article Details
+        # (column widths and row heights must be set before rows are written)
+        ws1 = wb.create_sheet("Article Details")
         ws1.column_dimensions['A'].width = 15
         ws1.column_dimensions['B'].width = 45
         ws1.column_dimensions['C'].width = 45
@@ -378,35 +576,44 @@ class ElPaisLocalScraper:
         ws1.column_dimensions['E'].width = 70
         for r in range(2, len(self.articles_data)+2):
             ws1.row_dimensions[r].height = 80
+        cols = [
+            'Article Number','Spanish Title','English Title',
+            'Spanish Content','English Content'
+        ]
+        ws1.append(styled(ws1, cols, 'hdr_style'))
+        for art in self.articles_data:
+            ws1.append(styled(ws1, [
+                art['article_number'], art['spanish_title'], art['english_title'],
+                art['spanish_content'], art['english_content']
+            ], 'bordered'))
         
         # Sheet2: Word Frequency Analysis
         ws2 = wb.create_sheet("Word Frequency Analysis")
-        ws2.merge_cells('A1:C1')
-        tcell = ws2['A1']
-        tcell.value = "Word Frequency Analysis – Repeated Words (>2)"
+        ws2.column_dimensions['A'].width = 10
+        ws2.column_dimensions['B'].width = 25
+        ws2.column_dimensions['C'].width = 15
+        ws2.merged_cells.add('A1:C1')
+        tcell = WriteOnlyCell(ws2, value="Word Frequency Analysis – Repeated Words (>2)")
         tcell.font = Font(name='Arial', size=14, bold=True)
         tcell.alignment = Alignment(horizontal='center')
+        ws2.append([tcell])
+        ws2.append([])
         headers = ['Rank','Word','Frequency']
-        for idx, h in enumerate(headers,1):
-            c = ws2.cell(row=3, column=idx, value=h)
-            c.font, c.fill, c.alignment, c.border = (
-                header_font, header_fill, header_align, thin
-            )
+        ws2.append(styled(ws2, headers, 'hdr_style'))
         counts, repeats = word_analysis
         items = sorted(repeats.items(), key=lambda x: x[1], reverse=True)
         for i,(w,cnt) in enumerate(items, start=1):
-            row = i+3
-            ws2.cell(row=row, column=1, value=i).border = thin
-            ws2.cell(row=row, column=2, value=w).border = thin
-            ws2.cell(row=row, column=3, value=cnt).border = thin
-        stats_row = len(items)+6 if items else 7
-        ws2.cell(row=stats_row, column=1, value="Total Unique Words:").font = Font(bold=True)
-        ws2.cell(row=stats_row, column=2, value=len(counts))
-        ws2.cell(row=stats_row+1, column=1, value="Words Repeated >2:").font = Font(bold=True)
-        ws2.cell(row=stats_row+1, column=2, value=len(repeats))
-        ws2.column_dimensions['A'].width = 10
-        ws2.column_dimensions['B'].width = 25
-        ws2.column_dimensions['C'].width = 15
+            ws2.append(styled(ws2, [i, w, cnt], 'bordered'))
+        # Stats block sits two blank rows below the table (three if empty)
+        for _ in range(2 if items else 3):
+            ws2.append([])
+        bold = Font(bold=True)
+        label = WriteOnlyCell(ws2, value="Total Unique Words:")
+        label.font = bold
+        ws2.append([label, len(counts)])
+        label = WriteOnlyCell(ws2, value="Words Repeated >2:")
+        label.font = bold
+        ws2.append([label, len(repeats)])
         
         wb.save(path)
         self.logger.info(f"Excel report saved: {path}")
@@ -446,8 +653,9 @@ SESSIONS = [
       "osVersion":  "12"
     }
 ]
-results_lock   = Lock()
-shared_results = []
+# Dedicated pool sized to the BrowserStack parallelism budget
+SESSION_POOL = ThreadPoolExecutor(max_workers=len(SESSIONS))
+atexit.register(SESSION_POOL.shutdown)
 
 def start_local_tunnel():
     
@@ -462,10 +670,6 @@ def start_local_tunnel():
     print(f"✅ BrowserStack Local tunnel started (ID: {local_id})")
     return bs_local, local_id
 
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.safari.options import Options as SafariOptions
 import traceback
 from selenium.common.exceptions import WebDriverException
 
@@ -612,98 +816,82 @@ def create_bs_driver(session_info, local_id):
 #         options=opts
 #     )
 
-def session_task(session_info, base_dir, local_id):
+def screenshot_task(session_info, base_dir, local_id):
     """
-    Run one BrowserStack session: scrape, download, translate,
-    take screenshot, and aggregate results safely.
+    Run one BrowserStack session: load the Opinion page and
+    save a screenshot for cross-browser verification.
     """
     # Determine platform (use 'os' for desktop, 'deviceName' for mobile)
     platform = session_info.get("os") or session_info.get("deviceName") or "Unknown"
     session_name = f"{session_info['browser']}_{platform}_{session_info['osVersion']}"
-
-    # Initialize your original scraper
-    scraper = ElPaisLocalScraper(base_dir=base_dir)
+    logger = logging.getLogger(__name__)
 
     # Create a BrowserStack driver (uses create_bs_driver as defined)
     driver = create_bs_driver(session_info, local_id)
 
     try:
-        # 1) Scrape articles
-        success = scraper.scrape_articles(driver)
-        if not success:
-            scraper.logger.error(f"[{session_name}] Scrape failed, skipping")
-            return
-
-        # 2) Download images and translate
-        scraper.download_all_images()
-        scraper.translate_content()
-
-        # 3) Capture landing-page screenshot
         shots_dir = os.path.join(base_dir, "browserstack_screenshots")
         os.makedirs(shots_dir, exist_ok=True)
-        driver.get(scraper.opinion_url)
-        time.sleep(10)
+        driver.get(OPINION_URL)
+        try:
+            WebDriverWait(driver, 25).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "article"))
+            )
+        except Exception:
+            logger.warning(f"[{session_name}] Timed out waiting for articles")
         shot_path = os.path.join(shots_dir, f"{session_name}.png")
         driver.save_screenshot(shot_path)
-        scraper.logger.info(f"[{session_name}] Screenshot saved: {shot_path}")
-
-        # 4) Aggregate results and safely rename images
-        with results_lock:
-            for art in scraper.articles_data:
-                orig = art.get("image_path", "")
-                if orig and os.path.exists(orig):
-                    dirname, fname = os.path.split(orig)
-                    new_fname = f"{session_name}__{fname}"
-                    new_path  = os.path.join(dirname, new_fname)
-
-                    if not os.path.exists(new_path):
-                        try:
-                            os.rename(orig, new_path)
-                            art["image_path"] = new_path
-                        except Exception as e:
-                            scraper.logger.error(f"[{session_name}] Error renaming {orig} → {new_path}: {e}")
-                    else:
-                        scraper.logger.warning(f"[{session_name}] Skipping rename, target exists: {new_path}")
-                else:
-                    scraper.logger.warning(f"[{session_name}] Image not found, cannot rename: {orig}")
-
-                # Tag with session name and add to shared list
-                art["session"] = session_name
-                shared_results.append(art)
-
+        logger.info(f"[{session_name}] Screenshot saved: {shot_path}")
     finally:
         driver.quit()
-        scraper.logger.info(f"[{session_name}] Session closed")
+        logger.info(f"[{session_name}] Session closed")
 
 def main():
     base_dir = sys.argv[1] if len(sys.argv)>1 else r"C:\Ridhi_Moda"
     os.makedirs(base_dir, exist_ok=True)
 
-    # 1) Start the BrowserStack Local tunnel
+    # 1) Scrape, download and translate once on a local driver,
+    #    reusing its page load for a per-run local screenshot
+    scraper = ElPaisLocalScraper(base_dir=base_dir)
+    driver = scraper.create_driver()
+    try:
+        success = scraper.scrape_articles(driver, shot_path=os.path.join(
+            base_dir,
+            f'opinion_page_screenshot_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
+        ))
+    finally:
+        driver.quit()
+    if success:
+        scraper.download_all_images()
+        scraper.translate_content()
+    else:
+        scraper.logger.error("Local scrape failed, report will be empty")
+
+    # 2) Start the BrowserStack Local tunnel
     bs_local, local_id = start_local_tunnel()
 
-    # 2) Run 5 sessions in parallel
+    # 3) Run 5 screenshot sessions in parallel
+    futs = []
     try:
         print(f"Running {len(SESSIONS)} BrowserStack sessions…")
-        with ThreadPoolExecutor(max_workers=5) as exe:
-            futs = [
-                exe.submit(
-                    session_task, sess, base_dir, local_id
-                ) for sess in SESSIONS
-            ]
-            for f in as_completed(futs):
-                f.result()
+        futs = [
+            SESSION_POOL.submit(
+                screenshot_task, sess, base_dir, local_id
+            ) for sess in SESSIONS
+        ]
+        for f in as_completed(futs):
+            f.result()
     finally:
+        # Let in-flight sessions finish before tearing down their tunnel
+        wait(futs)
         bs_local.stop()
         print("✅ BrowserStack Local tunnel stopped")
 
-    # 3) Merge results & create your final Excel
-    master = ElPaisLocalScraper(base_dir=base_dir)
-    master.articles_data = shared_results
-    word_analysis = master.analyze_word_frequency()
-    excel_path    = master.create_excel_report(word_analysis)
+    # 4) Analyze & create your final Excel
+    word_analysis = scraper.analyze_word_frequency()
+    excel_path    = scraper.create_excel_report(word_analysis)
 
-    # 4) Final summary
+    # 5) Final summary
     print("\n" + "="*60)
     print("✅ All sessions complete")
     print(f"📄 Excel report: {excel_path}")